@@ -4,8 +4,25 @@ This file contains all configurable parameters for the server.
 """
 
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Dict, Any
 
+# Default per-operation timeouts in seconds
+DEFAULT_OPERATION_TIMEOUTS = MappingProxyType({
+    "connection": 10.0,
+    "ping": 5.0,
+    "script_operation": 30.0,
+    "scene_operation": 60.0,
+    "gameobject_operation": 30.0,
+    "asset_operation": 45.0,
+    "editor_operation": 20.0,
+    "console_operation": 10.0,
+    "menu_operation": 15.0,
+    "shader_operation": 30.0,
+    "long_running": 300.0,
+    "max_timeout": 600.0
+})
+
 @dataclass
 class ServerConfig:
     """Main configuration class for the MCP server."""
@@ -55,20 +72,8 @@ class ServerConfig:
     def __post_init__(self):
         """Initialize default operation timeouts if not provided."""
         if self.operation_timeouts is None:
-            self.operation_timeouts = {
-                "connection": 10.0,
-                "ping": 5.0,
-                "script_operation": 30.0,
-                "scene_operation": 60.0,
-                "gameobject_operation": 30.0,
-                "asset_operation": 45.0,
-                "editor_operation": 20.0,
-                "console_operation": 10.0,
-                "menu_operation": 15.0,
-                "shader_operation": 30.0,
-                "long_running": 300.0,
-                "max_timeout": 600.0
-            }
+            # Each instance gets its own mutable copy of the shared defaults
+            self.operation_timeouts = dict(DEFAULT_OPERATION_TIMEOUTS)
 
 # Create a global config instance
 config = ServerConfig()
\ No newline at end of file
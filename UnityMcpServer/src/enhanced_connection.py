@@ -172,7 +172,7 @@ class EnhancedUnityConnection:
                     if self._verify_connection():
                         self.state = ConnectionState.CONNECTED
                         self.metrics.successful_connections += 1
-                        self._connection_start_time = time.time()
+                        self._connection_start_time = time.monotonic()
                         
                         enhanced_logger.info(
                             "Successfully connected to Unity",
@@ -244,7 +244,7 @@ class EnhancedUnityConnection:
             self._cleanup_socket()
             
             if self._connection_start_time:
-                self.metrics.connection_uptime += time.time() - self._connection_start_time
+                self.metrics.connection_uptime += time.monotonic() - self._connection_start_time
                 self._connection_start_time = None
             
             self.state = ConnectionState.DISCONNECTED
@@ -298,9 +298,9 @@ class EnhancedUnityConnection:
         
         for attempt in range(1, self.retry_config.max_attempts + 1):
             try:
-                start_time = time.time()
+                start_time = time.monotonic()
                 result = self._send_raw_command(command_type, params)
-                duration = time.time() - start_time
+                duration = time.monotonic() - start_time
                 
                 # Update metrics
                 self.metrics.successful_commands += 1
@@ -438,7 +438,7 @@ class EnhancedUnityConnection:
         }
         
         if self._connection_start_time:
-            metrics_dict["current_session_duration"] = time.time() - self._connection_start_time
+            metrics_dict["current_session_duration"] = time.monotonic() - self._connection_start_time
         
         return metrics_dict
 
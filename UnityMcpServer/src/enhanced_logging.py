@@ -7,18 +7,30 @@ and error tracking for production environments.
 import logging
 import logging.handlers
 import json
+import math
 import time
 import traceback
 from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from datetime import datetime
 from pathlib import Path
 import sys
 
 from config import config
 
+# Shared encoder; json.dumps with non-default options builds one per call
+_json_encoder = json.JSONEncoder(default=str, ensure_ascii=False)
 
-@dataclass
+# Standard LogRecord attributes that are not copied into structured output
+_RESERVED_RECORD_ATTRS = frozenset([
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+    'filename', 'module', 'lineno', 'funcName', 'created',
+    'msecs', 'relativeCreated', 'thread', 'threadName',
+    'processName', 'process', 'getMessage', 'exc_info', 'exc_text', 'stack_info'
+])
+
+
+@dataclass(slots=True)
 class LogContext:
     """Context information for log entries."""
     operation: Optional[str] = None
@@ -29,15 +41,44 @@ class LogContext:
     unity_connection_id: Optional[str] = None
     performance_metrics: Optional[Dict[str, Any]] = None
     additional_data: Optional[Dict[str, Any]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow field dict; avoids the recursive copy done by asdict()."""
+        return {name: getattr(self, name) for name in _LOG_CONTEXT_FIELDS}
+
+
+# Field names of LogContext, resolved once for to_dict()
+_LOG_CONTEXT_FIELDS = tuple(f.name for f in fields(LogContext))
 
 
 class StructuredFormatter(logging.Formatter):
     """Custom formatter for structured JSON logging."""
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (epoch second, local ISO string) of the last formatted second
+        self._second_cache = (None, "")
+    
+    def _format_timestamp(self, created: float) -> str:
+        """Format a timestamp like datetime.isoformat(), reusing the per-second prefix."""
+        frac, second = math.modf(created)
+        second = int(second)
+        microsecond = round(frac * 1e6)
+        if microsecond >= 1000000:
+            second += 1
+            microsecond -= 1000000
+        
+        cached_second, prefix = self._second_cache
+        if cached_second != second:
+            prefix = datetime.fromtimestamp(second).isoformat()
+            self._second_cache = (second, prefix)
+        
+        return f"{prefix}.{microsecond:06d}" if microsecond else prefix
+    
     def format(self, record: logging.LogRecord) -> str:
         # Base log entry
         log_entry = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -56,13 +97,10 @@ class StructuredFormatter(logging.Formatter):
         
         # Add custom fields from extra
         for key, value in record.__dict__.items():
-            if key not in ['name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 
-                          'filename', 'module', 'lineno', 'funcName', 'created', 
-                          'msecs', 'relativeCreated', 'thread', 'threadName', 
-                          'processName', 'process', 'getMessage', 'exc_info', 'exc_text', 'stack_info']:
+            if key not in _RESERVED_RECORD_ATTRS:
                 log_entry[key] = value
         
-        return json.dumps(log_entry, default=str, ensure_ascii=False)
+        return _json_encoder.encode(log_entry)
 
 
 class PerformanceLogger:
@@ -74,7 +112,7 @@ class PerformanceLogger:
     
     def start_operation(self, operation_id: str, operation_name: str, context: Dict[str, Any] = None):
         """Start tracking an operation."""
-        start_time = time.time()
+        start_time = time.monotonic()
         self._operation_starts[operation_id] = start_time
         
         self.logger.info(
@@ -90,7 +128,7 @@ class PerformanceLogger:
     def end_operation(self, operation_id: str, operation_name: str, success: bool = True, 
                      result_summary: str = None, context: Dict[str, Any] = None):
         """End tracking an operation."""
-        end_time = time.time()
+        end_time = time.monotonic()
         start_time = self._operation_starts.pop(operation_id, end_time)
         duration = end_time - start_time
         
@@ -175,9 +213,7 @@ class UnityMcpLogger:
     
     def log_with_context(self, level: int, message: str, context: LogContext = None, **kwargs):
         """Log a message with structured context."""
-        extra = {}
-        if context:
-            extra.update(asdict(context))
+        extra = context.to_dict() if context else {}
 
         # Handle special logging parameters separately to avoid conflicts
         exc_info = kwargs.pop('exc_info', None)
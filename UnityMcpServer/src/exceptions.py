@@ -4,6 +4,7 @@ Provides specific exception types for different error scenarios to enable
 better error handling, logging, and user feedback.
 """
 
+import functools
 import logging
 from typing import Optional, Dict, Any
 from enum import Enum
@@ -28,6 +29,12 @@ class ErrorCategory(Enum):
     INTERNAL = "internal"
 
 
+@functools.lru_cache(maxsize=None)
+def _error_code_for(error_class: type, category: ErrorCategory) -> str:
+    """Build the error code for an exception class and category once."""
+    return f"{category.value.upper()}_{error_class.__name__.upper()}"
+
+
 class UnityMcpError(Exception):
     """Base exception class for Unity MCP Server errors."""
     
@@ -50,8 +57,7 @@ class UnityMcpError(Exception):
         
     def _generate_error_code(self) -> str:
         """Generate a unique error code based on category and class name."""
-        class_name = self.__class__.__name__
-        return f"{self.category.value.upper()}_{class_name.upper()}"
+        return _error_code_for(self.__class__, self.category)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary for JSON serialization."""
@@ -163,18 +169,22 @@ class ConfigurationError(UnityMcpError):
             self.context["config_value"] = str(config_value)
 
 
+# Logging level used for each error severity
+_SEVERITY_LOG_LEVELS = {
+    ErrorSeverity.LOW: logging.INFO,
+    ErrorSeverity.MEDIUM: logging.WARNING,
+    ErrorSeverity.HIGH: logging.ERROR,
+    ErrorSeverity.CRITICAL: logging.CRITICAL
+}
+
+
 def log_exception(logger: logging.Logger, exception: UnityMcpError, extra_context: Dict[str, Any] = None):
     """Log an exception with full context information."""
     context = {**exception.context}
     if extra_context:
         context.update(extra_context)
     
-    log_level = {
-        ErrorSeverity.LOW: logging.INFO,
-        ErrorSeverity.MEDIUM: logging.WARNING,
-        ErrorSeverity.HIGH: logging.ERROR,
-        ErrorSeverity.CRITICAL: logging.CRITICAL
-    }.get(exception.severity, logging.ERROR)
+    log_level = _SEVERITY_LOG_LEVELS.get(exception.severity, logging.ERROR)
     
     logger.log(
         log_level,
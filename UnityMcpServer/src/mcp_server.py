@@ -59,7 +59,7 @@ class UnityConnection:
             if not self.connect():
                 return {"success": False, "error": "Not connected to Unity"}
 
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             # Convert old format to Unity Bridge format if needed
@@ -83,7 +83,7 @@ class UnityConnection:
             # Receive response
             logger.info("Waiting for Unity response...")
             response_data = self.socket.recv(4096).decode('utf-8')
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             logger.info(f"Received from Unity after {elapsed:.2f}s: {response_data}")
 
             response = json.loads(response_data)
@@ -97,13 +97,13 @@ class UnityConnection:
                 return {"success": False, "error": response.get("error", "Unknown error")}
 
         except socket.timeout:
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             logger.error(f"Unity command timed out after {elapsed:.2f}s")
             self.connected = False
             return {"success": False, "error": f"Command timed out after {elapsed:.2f}s"}
 
         except Exception as e:
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             logger.error(f"Unity command failed after {elapsed:.2f}s: {e}")
             self.connected = False
             return {"success": False, "error": str(e)}
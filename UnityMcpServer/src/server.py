@@ -60,7 +60,7 @@ class RobustUnityConnection:
             self.socket.settimeout(10.0)  # 10 second timeout
             self.socket.connect((self.host, self.port))
             self.connected = True
-            self.connection_start_time = time.time()
+            self.connection_start_time = time.monotonic()
 
             enhanced_logger.info(f"Successfully connected to Unity at {self.host}:{self.port}")
             return True
@@ -85,7 +85,7 @@ class RobustUnityConnection:
                 return {"success": False, "error": "Not connected to Unity"}
 
         self.total_commands += 1
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             # Convert old format to new format if needed
@@ -117,7 +117,7 @@ class RobustUnityConnection:
             enhanced_logger.info(f"Received response: {response_data}")
             response = json.loads(response_data)
 
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
 
             if response.get("status") == "success":
                 self.successful_commands += 1
@@ -131,14 +131,14 @@ class RobustUnityConnection:
 
         except socket.timeout:
             self.failed_commands += 1
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             enhanced_logger.error(f"Unity command timed out after {elapsed:.2f}s")
             self.connected = False
             return {"success": False, "error": "Command timed out"}
 
         except Exception as e:
             self.failed_commands += 1
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             enhanced_logger.error(f"Unity command failed after {elapsed:.2f}s: {e}")
             self.connected = False
             return {"success": False, "error": str(e)}
@@ -168,7 +168,7 @@ class RobustUnityConnection:
 
     def get_metrics(self):
         """Get connection metrics."""
-        uptime = time.time() - self.connection_start_time if self.connection_start_time else 0
+        uptime = time.monotonic() - self.connection_start_time if self.connection_start_time else 0
         success_rate = (self.successful_commands / self.total_commands * 100) if self.total_commands > 0 else 0
 
         return {
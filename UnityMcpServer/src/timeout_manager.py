@@ -34,6 +34,22 @@ class OperationType(Enum):
     LONG_RUNNING = "long_running"
 
 
+# TimeoutConfig field holding the timeout for each operation type
+_TIMEOUT_ATTRIBUTES = {
+    OperationType.CONNECTION: "connection_timeout",
+    OperationType.PING: "ping_timeout",
+    OperationType.SCRIPT_OPERATION: "script_operation_timeout",
+    OperationType.SCENE_OPERATION: "scene_operation_timeout",
+    OperationType.GAMEOBJECT_OPERATION: "gameobject_operation_timeout",
+    OperationType.ASSET_OPERATION: "asset_operation_timeout",
+    OperationType.EDITOR_OPERATION: "editor_operation_timeout",
+    OperationType.CONSOLE_OPERATION: "console_operation_timeout",
+    OperationType.MENU_OPERATION: "menu_operation_timeout",
+    OperationType.SHADER_OPERATION: "shader_operation_timeout",
+    OperationType.LONG_RUNNING: "long_running_timeout",
+}
+
+
 @dataclass
 class TimeoutConfig:
     """Configuration for operation timeouts."""
@@ -55,21 +71,8 @@ class TimeoutConfig:
     
     def get_timeout(self, operation_type: OperationType) -> float:
         """Get timeout for a specific operation type."""
-        timeout_map = {
-            OperationType.CONNECTION: self.connection_timeout,
-            OperationType.PING: self.ping_timeout,
-            OperationType.SCRIPT_OPERATION: self.script_operation_timeout,
-            OperationType.SCENE_OPERATION: self.scene_operation_timeout,
-            OperationType.GAMEOBJECT_OPERATION: self.gameobject_operation_timeout,
-            OperationType.ASSET_OPERATION: self.asset_operation_timeout,
-            OperationType.EDITOR_OPERATION: self.editor_operation_timeout,
-            OperationType.CONSOLE_OPERATION: self.console_operation_timeout,
-            OperationType.MENU_OPERATION: self.menu_operation_timeout,
-            OperationType.SHADER_OPERATION: self.shader_operation_timeout,
-            OperationType.LONG_RUNNING: self.long_running_timeout,
-        }
-        
-        timeout = timeout_map.get(operation_type, self.script_operation_timeout)
+        attribute = _TIMEOUT_ATTRIBUTES.get(operation_type)
+        timeout = getattr(self, attribute) if attribute else self.script_operation_timeout
         return min(timeout, self.max_timeout)
 
 
@@ -108,6 +111,7 @@ class TimeoutManager:
             op_name = operation_name or func.__name__
             
             start_time = time.time()
+            started = time.monotonic()
             operation_id = f"{op_name}_{start_time}"
             
             try:
@@ -116,13 +120,13 @@ class TimeoutManager:
                 
                 result = await asyncio.wait_for(func(*args, **kwargs), timeout=timeout)
                 
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - started
                 logger.debug(f"Operation '{op_name}' completed in {elapsed:.2f}s")
                 
                 return result
                 
             except asyncio.TimeoutError:
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - started
                 logger.error(f"Operation '{op_name}' timed out after {elapsed:.2f}s (limit: {timeout}s)")
                 raise UnityTimeoutError(
                     f"Operation '{op_name}' timed out after {timeout} seconds",
@@ -148,15 +152,11 @@ class TimeoutManager:
             timeout = timeout_override or self.config.get_timeout(operation_type)
             op_name = operation_name or func.__name__
             
-            async def run_with_timeout():
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(None, lambda: func(*args, **kwargs))
-            
             # Simple timeout implementation without asyncio.run to avoid event loop conflicts
-            start_time = time.time()
+            start_time = time.monotonic()
             try:
                 result = func(*args, **kwargs)
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
 
                 # Check if we exceeded timeout
                 if elapsed > timeout:
@@ -170,7 +170,7 @@ class TimeoutManager:
 
                 return result
             except Exception as e:
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 # Convert timeout-related exceptions
                 if "timeout" in str(e).lower():
                     logger.error(f"Sync operation '{op_name}' timed out: {str(e)}")
@@ -37,7 +37,7 @@ def register_execute_menu_item_tools(mcp: FastMCP):
             A dictionary indicating success or failure, with optional message/error.
         """
         request_id = str(uuid.uuid4())
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Set default action
         action = action.lower() if action else 'execute'
@@ -76,7 +76,7 @@ def register_execute_menu_item_tools(mcp: FastMCP):
             )
 
             # Log successful result
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "execute_menu_item", action, True,
                 result_summary=f"Menu item '{menu_path}' executed",
@@ -87,7 +87,7 @@ def register_execute_menu_item_tools(mcp: FastMCP):
             return result
 
         except ValidationError as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "execute_menu_item", action, False,
                 error_message=f"Validation error: {e.message}",
@@ -97,7 +97,7 @@ def register_execute_menu_item_tools(mcp: FastMCP):
             return create_error_response(e)
 
         except UnityOperationError as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "execute_menu_item", action, False,
                 error_message=e.message,
@@ -107,7 +107,7 @@ def register_execute_menu_item_tools(mcp: FastMCP):
             return create_error_response(e)
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.error(
                 f"Unexpected error in execute_menu_item.{action}",
                 context=log_context,
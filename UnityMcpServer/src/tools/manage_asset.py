@@ -50,7 +50,7 @@ def register_manage_asset_tools(mcp: FastMCP):
             A dictionary with operation results ('success', 'data', 'error').
         """
         request_id = str(uuid.uuid4())
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Create log context
         log_context = LogContext(
@@ -103,7 +103,7 @@ def register_manage_asset_tools(mcp: FastMCP):
             )
 
             # Log successful result
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "manage_asset", action, True,
                 result_summary=f"Asset {action} completed for '{path}'",
@@ -114,7 +114,7 @@ def register_manage_asset_tools(mcp: FastMCP):
             return result
 
         except ValidationError as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "manage_asset", action, False,
                 error_message=f"Validation error: {e.message}",
@@ -124,7 +124,7 @@ def register_manage_asset_tools(mcp: FastMCP):
             return create_error_response(e)
 
         except UnityOperationError as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "manage_asset", action, False,
                 error_message=e.message,
@@ -134,7 +134,7 @@ def register_manage_asset_tools(mcp: FastMCP):
             return create_error_response(e)
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.error(
                 f"Unexpected error in manage_asset.{action}",
                 context=log_context,
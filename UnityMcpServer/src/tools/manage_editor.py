@@ -35,7 +35,7 @@ def register_manage_editor_tools(mcp: FastMCP):
             Dictionary with operation results ('success', 'message', 'data').
         """
         request_id = str(uuid.uuid4())
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Create log context
         log_context = LogContext(
@@ -75,7 +75,7 @@ def register_manage_editor_tools(mcp: FastMCP):
             )
 
             # Log successful result
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "manage_editor", action, True,
                 result_summary=f"Editor {action} completed",
@@ -86,7 +86,7 @@ def register_manage_editor_tools(mcp: FastMCP):
             return result
 
         except ValidationError as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "manage_editor", action, False,
                 error_message=f"Validation error: {e.message}",
@@ -96,7 +96,7 @@ def register_manage_editor_tools(mcp: FastMCP):
             return create_error_response(e)
 
         except UnityOperationError as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "manage_editor", action, False,
                 error_message=e.message,
@@ -106,7 +106,7 @@ def register_manage_editor_tools(mcp: FastMCP):
             return create_error_response(e)
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.error(
                 f"Unexpected error in manage_editor.{action}",
                 context=log_context,
@@ -64,7 +64,7 @@ def register_manage_gameobject_tools(mcp: FastMCP):
             Dictionary with operation results ('success', 'message', 'data').
         """
         request_id = str(uuid.uuid4())
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Create log context
         log_context = LogContext(
@@ -130,7 +130,7 @@ def register_manage_gameobject_tools(mcp: FastMCP):
             )
 
             # Log successful result
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "manage_gameobject", action, True,
                 result_summary=f"GameObject {action} completed",
@@ -141,7 +141,7 @@ def register_manage_gameobject_tools(mcp: FastMCP):
             return result
 
         except ValidationError as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "manage_gameobject", action, False,
                 error_message=f"Validation error: {e.message}",
@@ -151,7 +151,7 @@ def register_manage_gameobject_tools(mcp: FastMCP):
             return create_error_response(e)
 
         except UnityOperationError as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "manage_gameobject", action, False,
                 error_message=e.message,
@@ -161,7 +161,7 @@ def register_manage_gameobject_tools(mcp: FastMCP):
             return create_error_response(e)
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.error(
                 f"Unexpected error in manage_gameobject.{action}",
                 context=log_context,
@@ -34,7 +34,7 @@ def register_manage_scene_tools(mcp: FastMCP):
             Dictionary with results ('success', 'message', 'data').
         """
         request_id = str(uuid.uuid4())
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Create log context
         log_context = LogContext(
@@ -72,7 +72,7 @@ def register_manage_scene_tools(mcp: FastMCP):
             )
 
             # Log successful result
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "manage_scene", action, True,
                 result_summary=f"Scene '{name}' {action} completed",
@@ -83,7 +83,7 @@ def register_manage_scene_tools(mcp: FastMCP):
             return result
 
         except ValidationError as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "manage_scene", action, False,
                 error_message=f"Validation error: {e.message}",
@@ -93,7 +93,7 @@ def register_manage_scene_tools(mcp: FastMCP):
             return create_error_response(e)
 
         except UnityOperationError as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "manage_scene", action, False,
                 error_message=e.message,
@@ -103,7 +103,7 @@ def register_manage_scene_tools(mcp: FastMCP):
             return create_error_response(e)
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.error(
                 f"Unexpected error in manage_scene.{action}",
                 context=log_context,
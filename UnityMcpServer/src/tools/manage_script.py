@@ -41,7 +41,7 @@ def register_manage_script_tools(mcp: FastMCP):
             Dictionary with results ('success', 'message', 'data').
         """
         request_id = str(uuid.uuid4())
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Create log context
         log_context = LogContext(
@@ -83,7 +83,7 @@ def register_manage_script_tools(mcp: FastMCP):
             )
 
             # Log successful result
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "manage_script", action, True,
                 result_summary=f"Script '{name}' {action} completed",
@@ -94,7 +94,7 @@ def register_manage_script_tools(mcp: FastMCP):
             return result
 
         except ValidationError as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "manage_script", action, False,
                 error_message=f"Validation error: {e.message}",
@@ -104,7 +104,7 @@ def register_manage_script_tools(mcp: FastMCP):
             return create_error_response(e)
 
         except (UnityOperationError, ResourceError) as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "manage_script", action, False,
                 error_message=e.message,
@@ -114,7 +114,7 @@ def register_manage_script_tools(mcp: FastMCP):
             return create_error_response(e)
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.error(
                 f"Unexpected error in manage_script.{action}",
                 context=log_context,
@@ -36,7 +36,7 @@ def register_manage_shader_tools(mcp: FastMCP):
             Dictionary with results ('success', 'message', 'data').
         """
         request_id = str(uuid.uuid4())
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Create log context
         log_context = LogContext(
@@ -74,7 +74,7 @@ def register_manage_shader_tools(mcp: FastMCP):
             )
 
             # Log successful result
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "manage_shader", action, True,
                 result_summary=f"Shader '{name}' {action} completed",
@@ -85,7 +85,7 @@ def register_manage_shader_tools(mcp: FastMCP):
             return result
 
         except ValidationError as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "manage_shader", action, False,
                 error_message=f"Validation error: {e.message}",
@@ -95,7 +95,7 @@ def register_manage_shader_tools(mcp: FastMCP):
             return create_error_response(e)
 
         except (UnityOperationError, ResourceError) as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "manage_shader", action, False,
                 error_message=e.message,
@@ -105,7 +105,7 @@ def register_manage_shader_tools(mcp: FastMCP):
             return create_error_response(e)
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.error(
                 f"Unexpected error in manage_shader.{action}",
                 context=log_context,
@@ -45,7 +45,7 @@ def register_read_console_tools(mcp: FastMCP):
             Dictionary with results. For 'get', includes 'data' (messages).
         """
         request_id = str(uuid.uuid4())
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Set defaults if values are None
         action = action if action is not None else 'get'
@@ -95,7 +95,7 @@ def register_read_console_tools(mcp: FastMCP):
             )
 
             # Log successful result
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "read_console", action, True,
                 result_summary=f"Console {action} completed",
@@ -106,7 +106,7 @@ def register_read_console_tools(mcp: FastMCP):
             return result
 
         except ValidationError as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "read_console", action, False,
                 error_message=f"Validation error: {e.message}",
@@ -116,7 +116,7 @@ def register_read_console_tools(mcp: FastMCP):
             return create_error_response(e)
 
         except UnityOperationError as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.log_tool_result(
                 "read_console", action, False,
                 error_message=e.message,
@@ -126,7 +126,7 @@ def register_read_console_tools(mcp: FastMCP):
             return create_error_response(e)
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             enhanced_logger.error(
                 f"Unexpected error in read_console.{action}",
                 context=log_context,
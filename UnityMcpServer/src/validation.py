@@ -5,13 +5,20 @@ to catch errors early and provide clear feedback.
 """
 
 import re
-from typing import Any, Dict, List, Optional, Union, Callable, Type
-from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union, Callable, Type, Pattern
+from dataclasses import dataclass, field
 from enum import Enum
 import os.path
 
 from exceptions import ValidationError
 
+# Characters rejected by path rules on this platform
+_INVALID_PATH_CHARS = '<>:"|?*' if os.name == 'nt' else '\0'
+_INVALID_PATH_CHARS_RE = re.compile(f"[{re.escape(_INVALID_PATH_CHARS)}]")
+
+# ASCII identifier accepted for C# class and asset names; \Z rejects a trailing newline
+IDENTIFIER_PATTERN = r'^[A-Za-z_][A-Za-z0-9_]*\Z'
+
 
 class ValidationType(Enum):
     """Types of validation rules."""
@@ -31,10 +38,20 @@ class ValidationRule:
     rule_type: ValidationType
     value: Any = None
     message: str = None
+    compiled_pattern: Optional[Pattern] = field(default=None, init=False, repr=False, compare=False)
+    choice_set: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if not self.message:
             self.message = self._generate_default_message()
+        # Compile pattern rules once instead of on every validate call
+        if self.rule_type == ValidationType.PATTERN:
+            self.compiled_pattern = re.compile(self.value)
+        elif self.rule_type == ValidationType.CHOICES and self.value is not None:
+            try:
+                self.choice_set = frozenset(self.value)
+            except TypeError:
+                pass  # Unhashable choices are checked against the list
     
     def _generate_default_message(self) -> str:
         """Generate default error message for the rule."""
@@ -61,15 +78,113 @@ class ValidationRule:
             return "Validation failed"
 
 
+def _check_required(value: Any, rule: ValidationRule) -> None:
+    if value is None or (isinstance(value, str) and not value.strip()):
+        raise ValidationError(rule.message)
+
+
+def _check_type(value: Any, rule: ValidationRule) -> None:
+    expected_type = rule.value
+    if not isinstance(value, expected_type):
+        raise ValidationError(
+            rule.message,
+            context={"expected_type": expected_type.__name__, "actual_type": type(value).__name__}
+        )
+
+
+def _check_range(value: Any, rule: ValidationRule) -> None:
+    min_val, max_val = rule.value
+    if not (min_val <= value <= max_val):
+        raise ValidationError(
+            rule.message,
+            context={"min_value": min_val, "max_value": max_val, "actual_value": value}
+        )
+
+
+def _check_length(value: Any, rule: ValidationRule) -> None:
+    min_len, max_len = rule.value
+    length = len(value) if hasattr(value, '__len__') else 0
+    if not (min_len <= length <= max_len):
+        raise ValidationError(
+            rule.message,
+            context={"min_length": min_len, "max_length": max_len, "actual_length": length}
+        )
+
+
+def _check_pattern(value: Any, rule: ValidationRule) -> None:
+    if isinstance(value, str) and not rule.compiled_pattern.match(value):
+        raise ValidationError(
+            rule.message,
+            context={"pattern": rule.value, "value": value}
+        )
+
+
+def _check_choices(value: Any, rule: ValidationRule) -> None:
+    choices = rule.value
+    if choices is None:
+        raise ValidationError("Choices validation rule has no valid choices defined")
+    try:
+        is_valid = value in (rule.choice_set if rule.choice_set is not None else choices)
+    except TypeError:
+        is_valid = False  # Unhashable value cannot match hashable choices
+    if not is_valid:
+        raise ValidationError(
+            rule.message,
+            context={"valid_choices": choices, "actual_value": value}
+        )
+
+
+def _check_path(value: Any, rule: ValidationRule) -> None:
+    if isinstance(value, str):
+        # Basic path validation - check for invalid characters
+        if _INVALID_PATH_CHARS_RE.search(value):
+            raise ValidationError(
+                rule.message,
+                context={"invalid_characters": _INVALID_PATH_CHARS, "path": value}
+            )
+
+
+def _check_custom(value: Any, rule: ValidationRule) -> None:
+    validator_func = rule.value
+    if callable(validator_func):
+        try:
+            if not validator_func(value):
+                raise ValidationError(rule.message)
+        except Exception as e:
+            raise ValidationError(
+                f"Custom validation failed: {str(e)}",
+                context={"custom_error": str(e)}
+            )
+
+
+# Check function for each rule type, looked up once per rule instead of
+# walking an if/elif chain
+_RULE_CHECKS: Dict[ValidationType, Callable[[Any, ValidationRule], None]] = {
+    ValidationType.REQUIRED: _check_required,
+    ValidationType.TYPE: _check_type,
+    ValidationType.RANGE: _check_range,
+    ValidationType.LENGTH: _check_length,
+    ValidationType.PATTERN: _check_pattern,
+    ValidationType.CHOICES: _check_choices,
+    ValidationType.PATH: _check_path,
+    ValidationType.CUSTOM: _check_custom,
+}
+
+
 class ParameterValidator:
     """Validates individual parameters."""
     
     def __init__(self, parameter_name: str, rules: List[ValidationRule]):
         self.parameter_name = parameter_name
         self.rules = rules
+        # Every rule except REQUIRED passes on None, so optional parameters
+        # that were not supplied can skip the rule walk entirely
+        self.is_required = any(rule.rule_type == ValidationType.REQUIRED for rule in rules)
     
     def validate(self, value: Any) -> None:
         """Validate a parameter value against all rules."""
+        if value is None and not self.is_required:
+            return
         for rule in self.rules:
             try:
                 self._validate_rule(value, rule)
@@ -84,78 +199,11 @@ class ParameterValidator:
     
     def _validate_rule(self, value: Any, rule: ValidationRule) -> None:
         """Validate a single rule."""
-        if rule.rule_type == ValidationType.REQUIRED:
-            if value is None or (isinstance(value, str) and not value.strip()):
-                raise ValidationError(rule.message)
-        
         # Skip other validations if value is None (unless required)
-        if value is None:
+        if value is None and rule.rule_type != ValidationType.REQUIRED:
             return
         
-        if rule.rule_type == ValidationType.TYPE:
-            expected_type = rule.value
-            if not isinstance(value, expected_type):
-                raise ValidationError(
-                    rule.message,
-                    context={"expected_type": expected_type.__name__, "actual_type": type(value).__name__}
-                )
-        
-        elif rule.rule_type == ValidationType.RANGE:
-            min_val, max_val = rule.value
-            if not (min_val <= value <= max_val):
-                raise ValidationError(
-                    rule.message,
-                    context={"min_value": min_val, "max_value": max_val, "actual_value": value}
-                )
-        
-        elif rule.rule_type == ValidationType.LENGTH:
-            min_len, max_len = rule.value
-            length = len(value) if hasattr(value, '__len__') else 0
-            if not (min_len <= length <= max_len):
-                raise ValidationError(
-                    rule.message,
-                    context={"min_length": min_len, "max_length": max_len, "actual_length": length}
-                )
-        
-        elif rule.rule_type == ValidationType.PATTERN:
-            pattern = rule.value
-            if isinstance(value, str) and not re.match(pattern, value):
-                raise ValidationError(
-                    rule.message,
-                    context={"pattern": pattern, "value": value}
-                )
-        
-        elif rule.rule_type == ValidationType.CHOICES:
-            choices = rule.value
-            if choices is None:
-                raise ValidationError("Choices validation rule has no valid choices defined")
-            if value not in choices:
-                raise ValidationError(
-                    rule.message,
-                    context={"valid_choices": choices, "actual_value": value}
-                )
-        
-        elif rule.rule_type == ValidationType.PATH:
-            if isinstance(value, str):
-                # Basic path validation - check for invalid characters
-                invalid_chars = '<>:"|?*' if os.name == 'nt' else '\0'
-                if any(char in value for char in invalid_chars):
-                    raise ValidationError(
-                        rule.message,
-                        context={"invalid_characters": invalid_chars, "path": value}
-                    )
-        
-        elif rule.rule_type == ValidationType.CUSTOM:
-            validator_func = rule.value
-            if callable(validator_func):
-                try:
-                    if not validator_func(value):
-                        raise ValidationError(rule.message)
-                except Exception as e:
-                    raise ValidationError(
-                        f"Custom validation failed: {str(e)}",
-                        context={"custom_error": str(e)}
-                    )
+        _RULE_CHECKS[rule.rule_type](value, rule)
 
 
 class ToolValidator:
@@ -264,7 +312,7 @@ def create_name_validator(required_param: bool = True) -> List[ValidationRule]:
     rules = [
         type_check(str),
         length_check(1, 255),
-        pattern_check(r'^[a-zA-Z_][a-zA-Z0-9_]*$')  # Valid identifier pattern
+        pattern_check(IDENTIFIER_PATTERN)
     ]
     if required_param:
         rules.insert(0, required())
@@ -442,15 +490,18 @@ _validator_registry: Dict[str, ToolValidator] = {}
 
 def get_tool_validator(tool_name: str) -> Optional[ToolValidator]:
     """Get validator for a specific tool."""
-    if tool_name not in _validator_registry:
-        # Create validator on first access
-        validator_factory = getattr(UnityToolValidators, f"create_{tool_name}_validator", None)
-        if validator_factory:
-            _validator_registry[tool_name] = validator_factory()
-        else:
-            return None
-
-    return _validator_registry[tool_name]
+    try:
+        return _validator_registry[tool_name]
+    except KeyError:
+        pass
+
+    # Create validator on first access
+    validator_factory = getattr(UnityToolValidators, f"create_{tool_name}_validator", None)
+    if not validator_factory:
+        return None
+
+    validator = _validator_registry[tool_name] = validator_factory()
+    return validator
 
 
 def validate_tool_parameters(tool_name: str, parameters: Dict[str, Any]) -> None:
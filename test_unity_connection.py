@@ -10,6 +10,7 @@ import json
 import time
 import sys
 import os
+from collections import Counter
 
 def test_unity_connection():
     """Test Unity connection and create detailed report."""
@@ -133,9 +134,10 @@ def test_unity_connection():
         print("   ⚠️  WARN - Bridge package not found in common locations")
     
     # Summary
-    passed = len([t for t in results["tests"] if t["status"] == "PASS"])
-    failed = len([t for t in results["tests"] if t["status"] == "FAIL"])
-    warned = len([t for t in results["tests"] if t["status"] == "WARN"])
+    status_counts = Counter(t["status"] for t in results["tests"])
+    passed = status_counts["PASS"]
+    failed = status_counts["FAIL"]
+    warned = status_counts["WARN"]
     
     results["summary"] = {
         "total_tests": len(results["tests"]),